@@ -23,8 +23,16 @@ class TestKeyPresses(unittest.TestCase):
     Flexes Waiting with various strategies.
     """
 
+    browsing: BrowseTheWeb
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.browsing = BrowseTheWeb.using(Firefox())
+
     def setUp(self) -> None:
-        self.actor = AnActor.named("Perry").who_can(BrowseTheWeb.using(Firefox()))
+        self.browsing.browser.delete_all_cookies()
+        self.browsing.browser.get("about:blank")
+        self.actor = AnActor.named("Perry").who_can(self.browsing)
 
     @act("Perform")
     @scene("Wait for text")
@@ -71,5 +79,6 @@ class TestKeyPresses(unittest.TestCase):
             See.the(Text.of_the(RESULT_TEXT), ReadsExactly(f"You entered: {test_text}"))
         )
 
-    def tearDown(self) -> None:
-        self.actor.exit_stage_right()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.browsing.forget()
@@ -37,8 +37,9 @@ class SeeAllOf:
 
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to make a series of observations."""
-        for question, resolution in self.tests:
-            the_actor.should(See.the(question, resolution))
+        the_actor.should(
+            *(See.the(question, resolution) for question, resolution in self.tests)
+        )
 
     def __init__(self, *tests: Tuple[Answerable, BaseResolution]) -> None:
         self.tests = tests
@@ -120,7 +120,9 @@ class Wait:
         browser = the_actor.ability_to(BrowseTheWeb).browser
 
         try:
-            WebDriverWait(browser, self.timeout).until(self.condition(*self.args))
+            WebDriverWait(browser, self.timeout, poll_frequency=self.poll).until(
+                self.condition(*self.args)
+            )
         except WebDriverException as e:
             msg = (
                 f"Encountered an exception using {self.condition.__name__} with "
@@ -131,5 +133,6 @@ class Wait:
     def __init__(self, seconds: int = 20, args: Optional[Iterable[Any]] = None) -> None:
         self.args = args if args is not None else []
         self.timeout = seconds
+        self.poll = 0.1
         self.condition = EC.visibility_of_element_located
         self.log_detail = None
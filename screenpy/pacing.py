@@ -6,13 +6,15 @@ and also set the logging severity for Python's built-in logging library.
 """
 
 import logging
+import os
 import re
-from contextlib import contextmanager
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Generator
+from operator import attrgetter
+from typing import Any, Callable
 
 import allure
+import allure_commons
 
 TRIVIAL = allure.severity_level.TRIVIAL
 MINOR = allure.severity_level.MINOR
@@ -24,44 +26,76 @@ BLOCKER = allure.severity_level.BLOCKER
 Function = Callable[..., Any]
 logger = logging.getLogger("screenpy")
 
+# Finds the named str.format() markers in a beat's line, like "{target}".
+BEAT_MARKERS = re.compile(r"\{([^0-9\}]+)}")
+
+# Set SCREENPY_NARRATION_DISABLED=1 to skip narrating beats and asides.
+NARRATION_DISABLED = os.environ.get("SCREENPY_NARRATION_DISABLED") == "1"
+
 
 class IndentManager:
     """Handle the indentation for CLI logging."""
 
+    __slots__ = (
+        "level",
+        "indent",
+        "whitespace",
+        "enabled",
+        "_cached",
+        "_cached_level",
+        "_cached_whitespace",
+    )
+
     def __init__(self) -> None:
         self.level = 0
         self.indent = 4
         self.whitespace = self.indent * " "
         self.enabled = True
+        self._cached = ""
+        self._cached_level = 0
+        self._cached_whitespace = self.whitespace
 
     def add_level(self) -> None:
         """Increase the indentation level."""
         self.level += 1
 
-    def remove_level(self) -> None:
+    def remove_level(self, *_: Any) -> None:
         """Decrease the indentation level."""
         if self.level > 0:
             self.level -= 1
 
-    @contextmanager
-    def next_level(self) -> Generator:
+    __enter__ = add_level
+    __exit__ = remove_level
+
+    def next_level(self) -> "IndentManager":
         """Move to the next level of indentation, with context."""
-        self.add_level()
-        try:
-            yield
-        finally:
-            self.remove_level()
+        return self
 
     def __str__(self) -> str:
-        if self.enabled:
-            return f"{self.level * self.whitespace}"
-        return ""
+        if not self.enabled:
+            return ""
+        if (
+            self.level != self._cached_level
+            or self.whitespace != self._cached_whitespace
+        ):
+            self._cached = self.level * self.whitespace
+            self._cached_level = self.level
+            self._cached_whitespace = self.whitespace
+        return self._cached
 
 
 # Indentation will be managed globally for the run.
 indent = IndentManager()
 
 
+def _nobody_is_listening() -> bool:
+    """Check that neither the log nor an Allure reporter would record a line."""
+    return not (
+        logger.isEnabledFor(logging.INFO)
+        or allure_commons.plugin_manager.hook.start_step.get_hookimpls()
+    )
+
+
 def act(title: str, gravitas: Enum = NORMAL) -> Callable[[Function], Function]:
     """Decorator to mark an "act".
 
@@ -75,12 +109,14 @@ def act(title: str, gravitas: Enum = NORMAL) -> Callable[[Function], Function]:
         gravitas: how serious this act is (the severity level).
     """
 
+    spoken_title = f"ACT {title.upper()}"
+
     def decorator(func: Function) -> Function:
         @allure.epic(title)
         @allure.severity(gravitas)
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.info(f"ACT {title.upper()}")
+            logger.info(spoken_title)
             return func(*args, **kwargs)
 
         return wrapper
@@ -101,12 +137,14 @@ def scene(title: str, gravitas: Enum = NORMAL) -> Callable[[Function], Function]
         gravitas: how serious this scene is (the severity level).
     """
 
+    spoken_title = f"Scene: {title.title()}"
+
     def decorator(func: Function) -> Function:
         @allure.feature(title)
         @allure.severity(gravitas)
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.info(f"Scene: {title.title()}")
+            logger.info(spoken_title)
             return func(*args, **kwargs)
 
         return wrapper
@@ -127,18 +165,32 @@ def beat(line: str) -> Callable[[Function], Function]:
     Args:
         line: the line spoken during this "beat" (the step description).
     """
+    markers = BEAT_MARKERS.findall(line)
+    get_cues = attrgetter(*markers) if markers else None
 
     def decorator(func: Function) -> Function:
+        if NARRATION_DISABLED:
+            return func
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _nobody_is_listening():
+                return func(*args, **kwargs)
+
             actor = args[1] if len(args) > 1 else ""
 
-            markers = re.findall(r"\{([^0-9\}]+)}", line)
-            cues = {mark: getattr(args[0], mark) for mark in markers}
-            completed_line = f"{indent}{line.format(actor, **cues)}"
+            if get_cues is None:
+                completed_line = line.format(actor)
+            else:
+                cues = get_cues(args[0])
+                if len(markers) == 1:
+                    cues = (cues,)
+                completed_line = line.format(actor, **dict(zip(markers, cues)))
+            if indent.enabled:
+                completed_line = f"{indent}{completed_line}"
             logger.info(completed_line)
             with allure.step(completed_line):
-                with indent.next_level():
+                with indent:
                     retval = func(*args, **kwargs)
                     if retval is not None:
                         aside(f"=> {retval}")
@@ -152,7 +204,10 @@ def beat(line: str) -> Callable[[Function], Function]:
 
 def aside(line: str) -> None:
     """A line spoken in a stage whisper to the audience (log a message)."""
-    completed_line = f"{indent}{line}"
+    if NARRATION_DISABLED or _nobody_is_listening():
+        return
+
+    completed_line = f"{indent}{line}" if indent.enabled else line
     logger.info(completed_line)
     with allure.step(completed_line):
         # Can't call method directly, have to enter or decorate
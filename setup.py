@@ -1,3 +1,5 @@
+import re
+from ast import literal_eval
 from os import path
 
 from setuptools import find_packages, setup
@@ -12,11 +14,13 @@ requires = [
 ]
 
 repo_dir = path.abspath(path.dirname(__file__))
-about = {}
-with open(path.join(repo_dir, "screenpy", "__version__.py"), "r") as f:
-    exec(f.read(), about)
+with open(path.join(repo_dir, "screenpy", "__version__.py"), encoding="utf-8") as f:
+    about = {
+        f"__{name}__": literal_eval(value)
+        for name, value in re.findall(r"^__(\w+)__ = (.+)$", f.read(), re.MULTILINE)
+    }
 
-with open("README.md", "r") as f:
+with open(path.join(repo_dir, "README.md"), encoding="utf-8") as f:
     readme = f.read()
 
 setup(
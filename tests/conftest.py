@@ -1,5 +1,6 @@
 from unittest import mock
 
+import allure
 import pytest
 
 from screenpy import AnActor
@@ -30,3 +31,12 @@ def APITester():
     MakeAPIRequests_Mocked.session = mock.Mock()
 
     return AnActor.named("Tester").who_can(MakeAPIRequests_Mocked)
+
+
+@pytest.fixture(scope="function")
+def mocked_allure(monkeypatch):
+    """Replace pacing's Allure module with a mock, to inspect its steps."""
+    mocked = mock.Mock(spec=allure)
+    mocked.step.return_value = mock.MagicMock()
+    monkeypatch.setattr("screenpy.pacing.allure", mocked)
+    return mocked
@@ -634,7 +634,9 @@ class TestWait:
         Tester.attempts_to(Wait.for_the(test_target))
 
         mocked_browser = Tester.ability_to(BrowseTheWeb).browser
-        mocked_webdriverwait.assert_called_once_with(mocked_browser, 20)
+        mocked_webdriverwait.assert_called_once_with(
+            mocked_browser, 20, poll_frequency=0.1
+        )
         mocked_ec.visibility_of_element_located.assert_called_once_with(test_target)
         mocked_webdriverwait.return_value.until.assert_called_once_with(
             mocked_ec.visibility_of_element_located.return_value
@@ -0,0 +1,219 @@
+import logging
+from unittest import mock
+
+import pytest
+
+from screenpy.pacing import IndentManager, act, aside, beat, indent, scene
+
+INDT = indent.whitespace
+
+
+@pytest.fixture(autouse=True)
+def log_info(caplog):
+    """Capture the narration logged at INFO level."""
+    caplog.set_level(logging.INFO)
+
+
+class Prop:
+    __slots__ = ("foo", "bar")
+
+    def __init__(self):
+        self.foo = "spam"
+        self.bar = "eggs"
+
+    @beat("{} uses the prop")
+    def use(self, the_actor):
+        pass
+
+    @beat("{} uses {foo}")
+    def use_foo(self, the_actor):
+        pass
+
+    @beat("{} uses {foo} and {bar}")
+    def use_foo_and_bar(self, the_actor):
+        pass
+
+    @beat("{} hands over the prop")
+    def hand_over(self, the_actor):
+        return "spam"
+
+    @beat("{} uses the prop")
+    def use_with_aside(self, the_actor):
+        aside("spam")
+
+    @beat("{} reaches for the prop")
+    def reach_for(self, the_actor):
+        self.use_with_aside(the_actor)
+
+    @beat("{} goes one level deeper")
+    def go_deeper(self, the_actor, depth):
+        if depth:
+            self.go_deeper(the_actor, depth - 1)
+        else:
+            aside("spam")
+
+
+EXPECTED_NESTED_STEPS = [
+    mock.call("Tester reaches for the prop"),
+    mock.call().__enter__(),
+    mock.call(f"{INDT}Tester uses the prop"),
+    mock.call().__enter__(),
+    mock.call(f"{INDT * 2}spam"),
+    mock.call().__enter__(),
+    mock.call().__exit__(None, None, None),
+    mock.call().__exit__(None, None, None),
+    mock.call().__exit__(None, None, None),
+]
+
+
+class TestIndentManager:
+    def test_adds_and_removes_levels(self):
+        im = IndentManager()
+
+        im.add_level()
+        im.add_level()
+        assert str(im) == 2 * im.whitespace
+
+        im.remove_level()
+        assert str(im) == im.whitespace
+
+    def test_does_not_go_below_zero(self):
+        im = IndentManager()
+
+        im.remove_level()
+
+        assert im.level == 0
+        assert str(im) == ""
+
+    def test_next_level(self):
+        im = IndentManager()
+
+        with im.next_level():
+            assert str(im) == im.whitespace
+
+        assert str(im) == ""
+
+    def test_is_its_own_context(self):
+        im = IndentManager()
+
+        with im:
+            with im:
+                assert str(im) == 2 * im.whitespace
+
+        assert str(im) == ""
+
+    def test_follows_direct_changes(self):
+        im = IndentManager()
+
+        im.level = 3
+        assert str(im) == 3 * im.whitespace
+
+        im.whitespace = "\t"
+        assert str(im) == "\t\t\t"
+
+    def test_disabled(self):
+        im = IndentManager()
+        im.enabled = False
+
+        im.add_level()
+
+        assert str(im) == ""
+
+
+class TestBeat:
+    def test_logs_and_steps(self, mocked_allure, caplog):
+        Prop().use("Tester")
+
+        assert caplog.messages == ["Tester uses the prop"]
+        mocked_allure.step.assert_called_once_with("Tester uses the prop")
+
+    def test_interpolations(self, caplog):
+        Prop().use_foo_and_bar("Tester")
+
+        assert caplog.messages == ["Tester uses spam and eggs"]
+
+    def test_single_interpolation(self, caplog):
+        Prop().use_foo("Tester")
+
+        assert caplog.messages == ["Tester uses spam"]
+
+    def test_nested_steps(self, mocked_allure):
+        Prop().reach_for("Tester")
+
+        assert mocked_allure.step.mock_calls == EXPECTED_NESTED_STEPS
+
+    @mock.patch("screenpy.pacing.allure_commons")
+    def test_stays_quiet_when_nobody_is_listening(
+        self, mocked_allure_commons, mocked_allure, caplog
+    ):
+        mocked_hook = mocked_allure_commons.plugin_manager.hook
+        mocked_hook.start_step.get_hookimpls.return_value = []
+
+        caplog.set_level(logging.WARNING)
+        retval = Prop().hand_over("Tester")
+
+        assert retval == "spam"
+        assert caplog.messages == []
+        mocked_allure.step.assert_not_called()
+
+
+class TestAside:
+    def test_logs_and_steps(self, mocked_allure, caplog):
+        aside("spam")
+
+        assert caplog.messages == ["spam"]
+        mocked_allure.step.assert_called_once_with("spam")
+
+    @mock.patch("screenpy.pacing.allure_commons")
+    def test_stays_quiet_when_nobody_is_listening(
+        self, mocked_allure_commons, mocked_allure, caplog
+    ):
+        mocked_hook = mocked_allure_commons.plugin_manager.hook
+        mocked_hook.start_step.get_hookimpls.return_value = []
+
+        caplog.set_level(logging.WARNING)
+        aside("spam")
+
+        assert caplog.messages == []
+        mocked_allure.step.assert_not_called()
+
+
+@mock.patch("screenpy.pacing.NARRATION_DISABLED", True)
+def test_narration_can_be_disabled(mocked_allure, caplog):
+    def use(self, the_actor):
+        pass
+
+    decorated = beat("{} uses the prop")(use)
+    aside("spam")
+
+    assert decorated is use
+    assert caplog.messages == []
+    mocked_allure.step.assert_not_called()
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+def test_indentation(caplog, depth):
+    Prop().go_deeper("Tester", depth)
+
+    expected = [
+        f"{INDT * level}Tester goes one level deeper" for level in range(depth + 1)
+    ]
+    assert caplog.messages == expected + [f"{INDT * (depth + 1)}spam"]
+
+
+@mock.patch("screenpy.pacing.indent.enabled", False)
+def test_indentation_disabled(caplog):
+    Prop().use_with_aside("Tester")
+
+    assert caplog.messages == ["Tester uses the prop", "spam"]
+
+
+def test_act_and_scene_announce_their_titles(caplog):
+    @act("test act")
+    @scene("test scene")
+    def test_func():
+        pass
+
+    test_func()
+
+    assert caplog.messages == ["ACT TEST ACT", "Scene: Test Scene"]